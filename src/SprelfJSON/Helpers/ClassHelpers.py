@@ -11,8 +11,6 @@ import pydoc
 import builtins
 import sys
 
-from SprelfJSON.Helpers.Decorators import yield_unique
-
 
 T = TypeVar('T')
 
@@ -37,7 +35,7 @@ def check_generic_subclass(check: Any, expected_origin: Any, *expected_args: Any
 
     origin, args = analyze_type(check)
 
-    if typing_inspect.is_union_type(expected_origin):
+    if not isinstance(expected_origin, type) and typing_inspect.is_union_type(expected_origin):
         return any(check_subclass(check, a) for a in expected_args)
 
     if not issubclass(origin, expected_origin):
@@ -58,7 +56,8 @@ def check_instance(check: Any, expected: Any) -> bool:
 
 
 def check_generic_instance(check: Any, expected_origin: Any, *expected_args: Any) -> bool:
-    if typing_inspect.is_union_type(expected_origin):
+    # Plain classes are never unions, and are by far the most common expected origin
+    if not isinstance(expected_origin, type) and typing_inspect.is_union_type(expected_origin):
         return any(check_instance(check, a) for a in expected_args)
 
     if expected_origin == Any:
@@ -135,11 +134,18 @@ def type_as_string(t: type) -> str:
 #
 
 
-@yield_unique
 def all_subclasses(t: type) -> Iterable[type]:
-    for c in t.__subclasses__():
+    # Walked iteratively in depth-first order, skipping anything already seen so that subclasses
+    # reachable through more than one parent (and everything beneath them) are only visited once
+    seen = set()
+    stack = t.__subclasses__()[::-1]
+    while stack:
+        c = stack.pop()
+        if c in seen:
+            continue
+        seen.add(c)
         yield c
-        yield from all_subclasses(c)
+        stack.extend(c.__subclasses__()[::-1])
 
 
 def get_module(t: type | ModuleType) -> ModuleType:
@@ -150,10 +156,19 @@ def full_name(t: type) -> str:
     return get_module(t).__name__ + "." + t.__name__
 
 
+# Classes found by their qualified name, which cannot change once found.  Results of the
+# searches through loaded modules and the call stack depend on the caller, so are not cached.
+_LOCATED_CLASSES: dict[str, type] = dict()
+
+
 def locate_class(name: str) -> type | None:
+    if name in _LOCATED_CLASSES:
+        return _LOCATED_CLASSES[name]
+
     # Try pydoc.locate first (handles fully qualified names)
     obj = pydoc.locate(name)
     if isinstance(obj, type):
+        _LOCATED_CLASSES[name] = obj
         return obj
 
     # Split the name (in case it's like "module.Class")
@@ -164,7 +179,10 @@ def locate_class(name: str) -> type | None:
 
         module = pydoc.locate(module_path)
         if isinstance(module, ModuleType):
-            return getattr(module, class_name, None)
+            obj = getattr(module, class_name, None)
+            if isinstance(obj, type):
+                _LOCATED_CLASSES[name] = obj
+            return obj
 
     # Try builtins
     if hasattr(builtins, name):
@@ -179,9 +197,10 @@ def locate_class(name: str) -> type | None:
             if isinstance(obj, type):
                 return obj
 
-    # Optionally: scan local and global scopes in the call stack
-    for frame_info in inspect.stack():
-        frame = frame_info.frame
+    # Optionally: scan local and global scopes in the call stack.  The frames are walked directly, as
+    # inspect.stack() also loads the source context of every frame, which is far more expensive.
+    frame = inspect.currentframe().f_back
+    while frame is not None:
         if name in frame.f_locals:
             obj = frame.f_locals[name]
             if isinstance(obj, type):
@@ -190,6 +209,7 @@ def locate_class(name: str) -> type | None:
             obj = frame.f_globals[name]
             if isinstance(obj, type):
                 return obj
+        frame = frame.f_back
 
     # Not found
     return None
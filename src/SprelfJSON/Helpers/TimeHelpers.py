@@ -1,4 +1,5 @@
-from datetime import datetime, date, time, timezone
+from datetime import datetime, date, time, timedelta, timezone
+import functools
 import re
 
 
@@ -9,7 +10,22 @@ TIME_FORMAT = "%H:%M:%S.%f"
 TIME_FORMAT2 = "%H:%M:%S"
 
 
-TIMEDELTA_REGEX = re.compile('^(days=(?P<d>\d+),)?(hours=(?P<h>\d+),)?(minutes=(?P<m>\d+),)?seconds=(?P<s>\d+)(\.(?P<ms>\d+))?$')
+TIMEDELTA_REGEX = re.compile(r"""
+    ^(?:days=(?P<d>\d+),)?
+    (?:hours=(?P<h>\d+),)?
+    (?:minutes=(?P<m>\d+),)?
+    seconds=(?P<s>\d+)(?:\.(?P<ms>\d+))?$
+""", re.VERBOSE)
+
+# Precompiled equivalents of the formats above, used to parse the common cases
+# without going through strptime
+DATETIME_REGEX = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d+))?Z?$")
+DATE_REGEX = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+TIME_REGEX = re.compile(r"^(\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d+))?$")
+
+# Timestamp strings are often repeated across records; the parsed values are immutable,
+# so they can safely be shared
+_PARSE_CACHE_SIZE = 4096
 
 
 def stringify_datetime(d: datetime) -> str:
@@ -32,23 +48,31 @@ def stringify_date(d: date):
     return d.strftime(DATE_FORMAT)
 
 
+def _fraction_to_microseconds(fraction: str | None) -> int:
+    return int(fraction[:6].ljust(6, "0")) if fraction else 0
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def parse_datetime_string(s: str) -> datetime:
+    # The C-level ISO parser handles the usual zero-padded forms (including a trailing 'Z') far faster
+    # than the regex; the regex still covers the looser forms it doesn't, such as unpadded fields
     try:
-        dt = datetime.fromisoformat(s.strip("Z"))
-        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+        dt = datetime.fromisoformat(s)
     except ValueError:
-        try:
-            return datetime.strptime(s, DATETIME_FORMAT).replace(tzinfo=timezone.utc)
-        except ValueError:
-            return datetime.strptime(s, DATETIME_FORMAT2).replace(tzinfo=timezone.utc)
+        if m := DATETIME_REGEX.match(s):
+            y, mo, d, h, mi, sec, fraction = m.groups()
+            return datetime(int(y), int(mo), int(d), int(h), int(mi), int(sec),
+                            _fraction_to_microseconds(fraction), tzinfo=timezone.utc)
+        dt = datetime.fromisoformat(s.strip("Z"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
 
 def parse_datetime(d: datetime | date | time | str | float | int) -> datetime:
-    if isinstance(d, datetime):
-        return d if d.tzinfo else d.replace(tzinfo=timezone.utc)
     if isinstance(d, str):
         return parse_datetime_string(d)
-    if isinstance(d, int) or isinstance(d, float):
+    if isinstance(d, datetime):
+        return d if d.tzinfo else d.replace(tzinfo=timezone.utc)
+    if isinstance(d, (int, float)):
         return datetime.fromtimestamp(d, tz=timezone.utc)
     if isinstance(d, date):
         return datetime(year=d.year, month=d.month, day=d.day, tzinfo=timezone.utc)
@@ -62,49 +86,71 @@ def parse_datetime(d: datetime | date | time | str | float | int) -> datetime:
     raise ValueError(f"Unable to smart-parse value as datetime: {d}")
 
 
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def parse_date_string(s: str) -> date:
+    try:
+        return date.fromisoformat(s)
+    except ValueError:
+        pass
+    if m := DATE_REGEX.match(s):
+        y, mo, d = m.groups()
+        return date(int(y), int(mo), int(d))
     try:
         return datetime.fromisoformat(s.strip("Z")).date()
     except ValueError:
-        try:
-            return datetime.strptime(s, DATE_FORMAT).date()
-        except ValueError:
-            return parse_datetime_string(s).date()
+        return parse_datetime_string(s).date()
 
 
 def parse_date(d: datetime | date | str | float | int) -> date:
-    if isinstance(d, date):
-        return d
     if isinstance(d, str):
         return parse_date_string(d)
-    if isinstance(d, int) or isinstance(d, float):
+    if isinstance(d, date):
+        return d
+    if isinstance(d, (int, float)):
         return datetime.fromtimestamp(d, tz=timezone.utc).date()
     if isinstance(d, datetime):
         return date(year=d.year, month=d.month, day=d.day)
     raise ValueError(f"Unable to smart-parse value as date: {d}")
 
 
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def parse_time_string(s: str) -> time:
-    try:
-        return datetime.fromisoformat(s.strip("Z")).time()
-    except ValueError:
+    # As for datetimes, the C-level ISO parser is tried first, but only on the HH:MM:SS[.fff] shape the
+    # regex accepts and for a naive result, since it also takes forms (such as offsets) the regex doesn't
+    if s[2:3] == ":" and s[5:6] == ":" and s[8:9] in ("", "."):
         try:
-            return datetime.strptime(s, TIME_FORMAT).time()
+            t = time.fromisoformat(s)
         except ValueError:
-            return datetime.strptime(s, TIME_FORMAT2).time()
+            pass
+        else:
+            if t.tzinfo is None:
+                return t
+    if m := TIME_REGEX.match(s):
+        h, mi, sec, fraction = m.groups()
+        return time(int(h), int(mi), int(sec), _fraction_to_microseconds(fraction))
+    return datetime.fromisoformat(s.strip("Z")).time()
 
 
 def parse_time(t: datetime | time | str | float | int) -> time:
-    if isinstance(t, time):
-        return t
     if isinstance(t, str):
         return parse_time_string(t)
-    if isinstance(t, int) or isinstance(t, float):
+    if isinstance(t, time):
+        return t
+    if isinstance(t, (int, float)):
         return datetime.fromtimestamp(t, tz=timezone.utc).time()
     if isinstance(t, datetime):
         return t.time()
     raise ValueError(f"Unable to smart-parse value as time: {t}")
 
 
+def parse_timedelta_string(s: str) -> timedelta:
+    if m := TIMEDELTA_REGEX.match(s):
+        d, h, mi, sec, fraction = m.groups("0")
+        # The digits after the point are a decimal fraction of a second, not a count of milliseconds
+        return timedelta(days=int(d), hours=int(h), minutes=int(mi), seconds=int(sec),
+                         microseconds=_fraction_to_microseconds(fraction))
+    raise ValueError(f"Unable to parse value as timedelta: {s}")
+
+
 def day(dt: datetime) -> datetime:
     return datetime.combine(dt.date(), datetime.min.time())
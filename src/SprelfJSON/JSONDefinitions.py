@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Self, MutableMapping, Sequence, get_origin, get_args, Collection, Mapping
-import collections
+from typing import Any, Self, Iterable, get_origin, get_args
+import collections.abc
 import inspect
 from types import NoneType
 from abc import ABC, abstractmethod
@@ -18,6 +18,20 @@ JSONType = JSONContainer | JSONValue
 FieldPath = str | int | tuple[str | int, ...]
 
 
+# Exact scalar types, checked by identity before falling back to isinstance() for subclasses
+_JSON_SCALARS = frozenset((NoneType, bool, int, float, str))
+_JSON_SCALAR_TYPES = (bool, int, float, str)
+
+# Which kinds of value each bound accepts, as (scalars, arrays, objects).  Comparing the unions
+# above for equality is slow, so the usual case of passing one of them is looked up by identity.
+_BOUNDS = ((JSONValue, (True, False, False)),
+           (JSONArray, (False, True, False)),
+           (JSONObject, (False, False, True)),
+           (JSONContainer, (False, True, True)),
+           (JSONType, (True, True, True)))
+_BOUNDS_BY_ID = {id(b): kinds for b, kinds in _BOUNDS}
+
+
 class SprelfJSONError(Exception):
 
     def __init__(self, *args):
@@ -27,12 +41,39 @@ class SprelfJSONError(Exception):
 #
 
 
+def _all_json_like(values: Iterable[Any]) -> bool:
+    """
+    Checks that each of the given values is JSON-like, walking nested containers with an explicit
+    stack rather than recursing through the JSON*Like instance checks.  A container reached more than
+    once (shared, or part of a cycle) is only walked the first time.
+    """
+    stack = list(values)
+    seen: dict[int, Any] = {}  # Holds the containers themselves, so their ids can't be reused mid-walk
+    while stack:
+        v = stack.pop()
+        if type(v) in _JSON_SCALARS or isinstance(v, _JSON_SCALAR_TYPES):
+            continue
+        if id(v) in seen:
+            continue
+        seen[id(v)] = v
+        if isinstance(v, _JSONObjectLike.ALLOWED):
+            if not all(isinstance(k, str) for k in v.keys()):
+                return False
+            stack.extend(v.values())
+        elif isinstance(v, _JSONArrayLike.ALLOWED):
+            if not _JSON_SCALARS.issuperset(map(type, v)):
+                stack.extend(v)
+        else:
+            return False
+    return True
+
+
 class _JSONObjectLike(type):
-    ALLOWED = (dict, MutableMapping, Mapping, collections.abc.MutableMapping, collections.abc.Mapping)
+    ALLOWED = (dict, collections.abc.Mapping)
 
     def __instancecheck__(cls, obj: Any) -> bool:
-        return obj is not None and isinstance(obj, cls.ALLOWED) and \
-            all(isinstance(v, JSONLike) for v in obj.values()) and all(isinstance(k, str) for k in obj.keys())
+        return isinstance(obj, cls.ALLOWED) and all(isinstance(k, str) for k in obj.keys()) and \
+            _all_json_like(obj.values())
 
     def __subclasscheck__(cls, t: type) -> bool:
         if t == JSONObjectLike:
@@ -63,12 +104,12 @@ class JSONValueLike(metaclass=_JSONValueLike):
 
 
 class _JSONArrayLike(type):
-    ALLOWED = (list, Sequence, collections.abc.Sequence)
+    ALLOWED = (list, collections.abc.Sequence)
 
     def __instancecheck__(cls, obj: Any) -> bool:
         return obj is not None and isinstance(obj, cls.ALLOWED) and \
             not isinstance(obj, str) and \
-            all(isinstance(elem, JSONLike) for elem in obj)
+            (_JSON_SCALARS.issuperset(map(type, obj)) or _all_json_like(obj))
 
     def __subclasscheck__(cls, t: type) -> bool:
         if t == JSONArrayLike:
@@ -101,7 +142,7 @@ class JSONContainerLike(metaclass=_JSONContainerLike):
 
 class _JSONLike(type):
     def __instancecheck__(self, obj: Any) -> bool:
-        return isinstance(obj, (JSONValueLike, JSONObjectLike, JSONArrayLike))
+        return type(obj) in _JSON_SCALARS or _all_json_like((obj,))
 
     def __subclasscheck__(cls, t: type) -> bool:
         if t in (JSONLike, JSONObjectLike, JSONArrayLike, JSONValueLike, JSONContainerLike):
@@ -118,19 +159,25 @@ class JSONLike(metaclass=_JSONLike):
 
 def is_json_type(value: Any,
                  bound: type[JSONValue] | type[JSONObject] | type[JSONArray] | type[JSONContainer] | type[JSONType] = JSONType) -> bool:
-    if value is None:
-        return bound in (JSONValue, JSONType)
-    if isinstance(value, (bool, int, float, str)):
-        return bound in (JSONValue, JSONType)
+    kinds = _BOUNDS_BY_ID.get(id(bound))
+    if kinds is None:
+        kinds = next((k for b, k in _BOUNDS if b == bound), (False, False, False))
+    scalars, arrays, objects = kinds
+    if type(value) in _JSON_SCALARS or isinstance(value, _JSON_SCALAR_TYPES):
+        return scalars
     if isinstance(value, list):
-        return bound in (JSONArray, JSONContainer, JSONType) and all(is_json_type(item) for item in value)
+        # Arrays of plain scalars are settled in a single C-level pass before any per-item checks
+        return arrays and (_JSON_SCALARS.issuperset(map(type, value)) or
+                           all(type(item) in _JSON_SCALARS or is_json_type(item) for item in value))
     if isinstance(value, dict):
-        return bound in (JSONObject, JSONContainer, JSONType) and all(isinstance(k, str) and is_json_type(v)
-                                                                      for k, v in value.items())
+        return objects and \
+            all(isinstance(k, str) and (type(v) in _JSON_SCALARS or is_json_type(v)) for k, v in value.items())
     return False
 
 
 class JSONable(ABC):
+    # Declares no instance state, so that subclasses using __slots__ can do without a __dict__
+    __slots__ = ()
 
     @abstractmethod
     def to_json(self, **kwargs) -> JSONObject:
@@ -138,6 +185,7 @@ class JSONable(ABC):
 
 
 class JSONConvertible(JSONable, ABC):
+    __slots__ = ()
 
     @classmethod
     @abstractmethod
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from abc import ABCMeta, ABC, abstractmethod
-from typing import Any, Hashable, Self, Mapping, dataclass_transform, TypeAlias
-from types import resolve_bases, new_class, GenericAlias
+from typing import Any, Hashable, Self, Mapping, Callable, Iterable, dataclass_transform, TypeAlias
+from types import resolve_bases, new_class
+from collections import ChainMap
+from weakref import WeakValueDictionary
 import typing
 import itertools
 import inspect
-
-import typing_inspect
+import operator
+import keyword
 
 from SprelfJSON import JSONArrayLike
 from SprelfJSON.JSONModel.ModelElem import ModelElem, ModelElemError, SupportedTypeMap, AlternateModelElem
@@ -20,25 +22,183 @@ from SprelfJSON.Helpers import ClassHelpers
 #
 
 
+_ModelField: TypeAlias = tuple[str, ModelElem, bool, bool, Callable[..., Any]]
+
+
+def _model_fields(model: Mapping[str, ModelElem]) -> tuple[_ModelField, ...]:
+    """
+    Flattens the given model into (key, elem, ignored, has_default, validate) entries, so that
+    validation does not need to query each ModelElem for these flags or resolve its validate()
+    method on every call.
+    """
+    return tuple((k, m, m.ignored, m.has_default(), m.validate) for k, m in model.items())
+
+
+_DumpField: TypeAlias = tuple[str, ModelElem, bool, Callable[..., Any]]
+
+
+def _dump_fields(model: Mapping[str, ModelElem]) -> tuple[_DumpField, ...]:
+    """
+    Flattens the given model into (key, elem, has_default, dump_value) entries for just the fields
+    that appear in JSON output, leaving out ignored and ephemeral fields up front.
+    """
+    return tuple((k, m, m.has_default(), m.dump_value) for k, m in model.items()
+                 if not m.ignored and not m.ephemeral)
+
+
+_MISSING = object()
+
+
+def _field_getter(keys: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """
+    Builds a function fetching all the given attributes of an object at once, always as a tuple.
+    """
+    if not keys:
+        return lambda _: ()
+    if len(keys) == 1:
+        single = operator.attrgetter(keys[0])
+        return lambda o: (single(o),)
+    return operator.attrgetter(*keys)
+
+
+def _all_identifiers(keys: Iterable[str]) -> bool:
+    """
+    Whether all the given field names can be written into generated source code as they are, which
+    excludes keys that aren't valid identifiers (such as 'my-field') or are reserved keywords.
+    """
+    return all(k.isidentifier() and not keyword.iskeyword(k) for k in keys)
+
+
+def _build_init(cls: JSONModelMeta) -> Callable[..., None]:
+    """
+    Generates an __init__ specialized to the fields of the given model class, which validates
+    and assigns each field directly rather than going through validate_model().  Anything the
+    specialized version does not handle (unrecognized keys, or being called via super() from a
+    subclass with its own __init__) is deferred to the generic JSONModel.__init__.
+    """
+    names = tuple(k for k, *_ in cls.__model_fields__)
+    # Fields become parameters of the generated function, so any builtin it uses is bound under a
+    # private name, where a field (such as 'type') cannot shadow it
+    namespace: dict[str, Any] = {"_cls": cls, "_names": names, "_MISSING": _MISSING,
+                                 "_generic_init": JSONModel.__init__, "_type": type, "_zip": zip, "_str": str,
+                                 "_JSONModelError": JSONModelError, "_ModelElemError": ModelElemError}
+    args = "".join(f"{k}, " for k in names)
+    lines = [f"def __init__(_self, *, {''.join(f'{k}=_MISSING, ' for k in names)}_ignore_extra=_MISSING, **_extra):",
+             f"    if _extra or _type(_self) is not _cls:",
+             f"        _kwargs = {{_k: _v for _k, _v in _zip(_names, ({args})) if _v is not _MISSING}}",
+             f"        if _ignore_extra is not _MISSING:",
+             f"            _kwargs['_ignore_extra'] = _ignore_extra",
+             f"        return _generic_init(_self, **_kwargs, **_extra)"]
+    assigned = []
+    for i, (k, m, ignored, has_default, validate) in enumerate(cls.__model_fields__):
+        if ignored:
+            continue
+        namespace[f"_elem{i}"] = m
+        namespace[f"_validate{i}"] = validate
+        lines.append(f"    if {k} is _MISSING:")
+        if has_default and type(m).default is ModelElem.default:
+            # Resolved here rather than through the default property, which re-checks which kind it is
+            if m._default_factory is not None:
+                namespace[f"_factory{i}"] = m._default_factory
+                lines.append(f"        {k} = _factory{i}()")
+            else:
+                namespace[f"_default{i}"] = m._default[0]
+                lines.append(f"        {k} = _default{i}")
+        elif has_default:
+            lines.append(f"        {k} = _elem{i}.default")
+        else:
+            lines.append(f"        raise _JSONModelError({f'Missing required key {k!r} on {cls.__name__!r}.'!r})")
+        lines += [f"    try:",
+                  f"        {k} = _validate{i}({k}, key={k!r})",
+                  f"    except _ModelElemError as _e:",
+                  f"        raise _JSONModelError({f'Model error on key {k!r} of {cls.__name__!r}: '!r} + _str(_e))"]
+        assigned.append(k)
+    lines += [f"    _self.{k} = {k}" for k in assigned]
+
+    exec("\n".join(lines), namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__module__ = cls.__module__
+    init.__json_model_generated__ = True
+    return init
+
+
+def _build_to_json(cls: JSONModelMeta) -> Callable[..., JSONObject]:
+    """
+    Generates a to_json() specialized to the fields of the given model class, which reads, compares
+    against the default and dumps each field in turn rather than looping over __dump_fields__.  The
+    output flags are still read from the class on each call.  Instances of subclasses that inherit
+    it without getting their own are deferred to the generic JSONModel.to_json.
+    """
+    namespace: dict[str, Any] = {"_cls": cls, "_generic_to_json": JSONModel.to_json}
+    lines = [f"def to_json(_self, **_kwargs):",
+             f"    if type(_self) is not _cls:",
+             f"        return _generic_to_json(_self, **_kwargs)",
+             f"    _include_defaults = _cls.__include_defaults_in_json_output__",
+             f"    _allow_null = _cls.__allow_null_json_output__",
+             f"    _dumped = {{}}"]
+    for i, (k, m, has_default, dump_value) in enumerate(cls.__dump_fields__):
+        namespace[f"_dump{i}"] = dump_value
+        lines.append(f"    _value = _self.{k}")
+        indent = "    "
+        if has_default:
+            if type(m).default is ModelElem.default and m._default_factory is None:
+                # A value left at its static default is usually that very object, which is
+                # cheaper to recognize by identity than by comparison
+                namespace[f"_default{i}"] = m._default[0]
+                lines.append(f"    if _include_defaults or (_value is not _default{i} and _value != _default{i}):")
+            else:
+                namespace[f"_elem{i}"] = m
+                lines.append(f"    if _include_defaults or _value != _elem{i}.default:")
+            indent += "    "
+        lines += [f"{indent}_value = _dump{i}(_value, key={k!r})",
+                  f"{indent}if _allow_null or _value is not None:",
+                  f"{indent}    _dumped[{k!r}] = _value"]
+    lines += [f"    if _cls.__include_name_in_json_output__:",
+              f"        _name_field, _identity = _cls._name_entry()",
+              f"        _dumped[_name_field] = _identity",
+              f"    return _dumped"]
+
+    exec("\n".join(lines), namespace)
+    to_json = namespace["to_json"]
+    to_json.__qualname__ = f"{cls.__qualname__}.to_json"
+    to_json.__module__ = cls.__module__
+    to_json.__doc__ = JSONModel.to_json.__doc__
+    to_json.__json_model_generated__ = True
+    return to_json
+
+
 @dataclass_transform(kw_only_default=True, field_specifiers=(ModelElem,))
 class JSONModelMeta(ABCMeta):
     _ANNO = '__annotations__'
     _FIELDS = "_fields"
     _JSON_MODEL = "__json_model__"
+    _MODEL = "__model__"
+    _MODEL_FIELDS = "__model_fields__"
+    _DUMP_FIELDS = "__dump_fields__"
+    _EPHEMERAL_FIELDS = "__ephemeral_fields__"
     _DEFAULTS = "__defaults__"
-    __json_model__: dict[str, ModelElem]
+    __json_model__: dict[str, ModelElem] = {}
+    __model__: dict[str, ModelElem] = {}
+    __model_fields__: tuple[_ModelField, ...] = ()
+    __dump_fields__: tuple[_DumpField, ...] = ()
+    __ephemeral_fields__: frozenset[str] = frozenset()
+    __field_getter__: Callable[[Any], tuple[Any, ...]] = staticmethod(lambda _: ())
     __name_field__: str = "__name"
     __name_field_required__: bool = False
     __include_name_in_json_output__: bool = False
     __allow_null_json_output__: bool = False
     __include_defaults_in_json_output__: bool = False
     __allow_extra_fields__: bool = False
-    __exclusions__: list[str] = []
+    __use_slots__: bool = False
+    __exclusions__: frozenset[str] = frozenset()
     __eval_context__ = {**globals(),
                         **SupportedTypeMap,
                         **typing.__dict__,
                         ModelElem.__name__: ModelElem,
                         AlternateModelElem.__name__: AlternateModelElem}
+    # Every JSONModel class created so far by name, used when evaluating annotations
+    _MODEL_NAMES: WeakValueDictionary[str, JSONModelMeta] = WeakValueDictionary()
     __annotation_conversions__ = {JSONObject: JSONObjectLike,
                                   JSONArray: JSONArrayLike,
                                   JSONType: JSONLike,
@@ -46,19 +206,32 @@ class JSONModelMeta(ABCMeta):
                                   JSONValue: JSONValueLike}
 
     @classmethod
-    def _eval(cls, s: Any, context: dict):
-        if s is None or inspect.isclass(s) or typing_inspect.is_generic_type(s) or typing_inspect.is_union_type(s) or \
-                typing_inspect.is_optional_type(s) or isinstance(s, ModelElem) or type(s) == GenericAlias:
+    def _eval(cls, s: Any, context: Mapping[str, Any]):
+        # Only string annotations need evaluating; anything else (classes, generic aliases, unions,
+        # ModelElems, etc.) is already an evaluated type
+        if not isinstance(s, str):
             return s
+        # The common case is a bare class name, which can be looked up directly without eval()
+        if s.isidentifier():
+            found = context.get(s, _MISSING)
+            if found is _MISSING:
+                found = JSONModelMeta.__eval_context__.get(s, _MISSING)
+            if found is not _MISSING:
+                return found
         try:
-            return eval(s, context)
-        except:
+            return eval(s, JSONModelMeta.__eval_context__, context)
+        except (NameError, AttributeError, SyntaxError, TypeError):
             if c := ClassHelpers.locate_class(s):
                 return c
             raise JSONModelError(f"Unable to evaluate '{s}' as a type; has it been instantiated yet?  Be sure "
                                  f"nested classes are defined before the classes they're nested in, and "
                                  f"avoid circular references.")
 
+    @staticmethod
+    def _declared_slots(namespace: Mapping[str, Any]) -> tuple[str, ...]:
+        slots = namespace.get("__slots__", ())
+        return (slots,) if isinstance(slots, str) else tuple(slots)
+
     #
 
     def __new__(mcls: type[JSONModelMeta],
@@ -110,23 +283,42 @@ class JSONModelMeta(ABCMeta):
                 defaults[field] = getattr(mcls, field)
 
         #
-        # Fill in the namespace and build
+        # Fill in the namespace and build.  If slots are enabled, every field not already slotted by a
+        # base gets a slot; default values are tracked in __defaults__, so they are removed from the
+        # namespace to avoid conflicting with (or shadowing) the slots.
         #
         namespace = {
             **namespace,
             mcls._DEFAULTS: defaults
         }
+        if "__exclusions__" in namespace:
+            namespace["__exclusions__"] = frozenset(namespace["__exclusions__"])
+        if namespace.get("__use_slots__", any(getattr(base, "__use_slots__", False) for base in bases)):
+            inherited_slots = {slot for base in bases for c in base.__mro__
+                               for slot in mcls._declared_slots(c.__dict__)}
+            slots = tuple(k for k in given_anno.keys() if k not in inherited_slots)
+            # The bases declare no instance state, so the first slotted class also restores weak references
+            if not any(hasattr(base, "__weakref__") for base in bases) and \
+                    "__weakref__" not in mcls._declared_slots(namespace):
+                slots = (*slots, "__weakref__")
+            namespace = {k: v for k, v in namespace.items() if k not in given_anno}
+            namespace["__slots__"] = (*mcls._declared_slots(namespace), *slots)
 
         new_cls = BUILD(name, bases, namespace)
+        JSONModel._SUBCLASS_CACHE.clear()
+        JSONModel._IDENTITY_CACHE.clear()
 
         #
         # Parse the annotated strings to get actual types to enforce
         #
-        eval_context = {**JSONModelMeta.__eval_context__,
-                        **locals(),
-                        **{k: v for frame in reversed(inspect.stack()) for k, v in frame.frame.f_locals.items()},
-                        new_cls.__name__: new_cls,
-                        **{sc.__name__: sc for sc in ClassHelpers.all_subclasses(JSONModel)}}
+        mcls._MODEL_NAMES[new_cls.__name__] = new_cls
+        frame_locals = []
+        frame = inspect.currentframe()
+        while frame is not None:
+            frame_locals.append(frame.f_locals)
+            frame = frame.f_back
+        del frame
+        eval_context = ChainMap(mcls._MODEL_NAMES, *frame_locals)
 
         evaluated_anno = {k: mcls._eval(v, eval_context)
                           for k, v in given_anno.items()}
@@ -138,7 +330,7 @@ class JSONModelMeta(ABCMeta):
                 return v
             d = defaults.get(k, ())
             _orig, _gener = ClassHelpers.analyze_type(v)
-            if d != () and inspect.isclass(_orig) and any(issubclass(_orig, x) for x in (list, dict, set)):
+            if d != () and inspect.isclass(_orig) and issubclass(_orig, (list, dict, set)):
                 if len(d) == 0:
                     return ModelElem(v, default_factory=_orig)
                 else:
@@ -149,12 +341,33 @@ class JSONModelMeta(ABCMeta):
             {k: _build_model_elem(k, v)
              for k, v in evaluated_anno.items()}
         clean_anno = {k: v.annotated_type for k, v in full_anno.items()}
-        required = [n for n in full_anno.keys() if n not in defaults]
         setattr(new_cls, mcls._FIELDS, tuple(given_anno.keys()))
         setattr(new_cls, mcls._ANNO, given_anno)
         setattr(new_cls, mcls._JSON_MODEL, full_anno)
+        model = {k: v for k, v in full_anno.items()
+                 if k not in new_cls.__exclusions__}
+        setattr(new_cls, mcls._MODEL, model)
+        setattr(new_cls, mcls._MODEL_FIELDS, _model_fields(model))
+        setattr(new_cls, mcls._DUMP_FIELDS, _dump_fields(model))
+        setattr(new_cls, "__field_getter__", _field_getter(tuple(model.keys())))
+        setattr(new_cls, mcls._EPHEMERAL_FIELDS, frozenset(k for k, v in model.items() if v.ephemeral))
         setattr(new_cls, "__resolved_anno__", clean_anno)
-        setattr(new_cls, "__slots__", required)
+
+        # Only specialize __init__ if neither it nor the model and validation it relies on have been customized
+        init = new_cls.__init__
+        if (init is JSONModel.__init__ or getattr(init, "__json_model_generated__", False)) and \
+                new_cls.model.__func__ is JSONModel.model.__func__ and \
+                new_cls.validate_model.__func__ is JSONModel.validate_model.__func__ and \
+                new_cls._validate_model.__func__ is JSONModel._validate_model.__func__ and \
+                _all_identifiers(k for k, *_ in new_cls.__model_fields__):
+            setattr(new_cls, "__init__", _build_init(new_cls))
+
+        # Likewise for to_json
+        to_json = new_cls.to_json
+        if (to_json is JSONModel.to_json or getattr(to_json, "__json_model_generated__", False)) and \
+                new_cls.model.__func__ is JSONModel.model.__func__ and \
+                _all_identifiers(k for k, *_ in new_cls.__dump_fields__):
+            setattr(new_cls, "to_json", _build_to_json(new_cls))
 
         return new_cls
 
@@ -166,7 +379,11 @@ class JSONModelMeta(ABCMeta):
 
 
 class JSONModel(JSONConvertible, ABC, metaclass=JSONModelMeta):
+    # Only slotted subclasses (see __use_slots__) go without a __dict__; all others still get one
+    __slots__ = ()
     _MODEL_CACHE: dict[tuple[Hashable, JSONModelMeta], JSONModelMeta] = dict()
+    _SUBCLASS_CACHE: dict[JSONModelMeta, tuple[JSONModelMeta, ...]] = dict()
+    _IDENTITY_CACHE: dict[JSONModelMeta, dict[Hashable, JSONModelMeta]] = dict()
 
     def __init__(self, **kwargs):
         model = type(self).model()
@@ -177,7 +394,7 @@ class JSONModel(JSONConvertible, ABC, metaclass=JSONModelMeta):
             setattr(self, k, v)
 
     def __repr__(self) -> str:
-        parts = ",".join(f"{k}={getattr(self, k)!r}" for k in self.model().keys())
+        parts = ",".join(map("{}={!r}".format, self.model().keys(), type(self).__field_getter__(self)))
         return f"{type(self).__name__}({parts})"
 
     def __str__(self) -> str:
@@ -186,19 +403,20 @@ class JSONModel(JSONConvertible, ABC, metaclass=JSONModelMeta):
     @classmethod
     def model(cls) -> dict[str, ModelElem]:
         """
-        Retrieves the JSON model definition for objects of this type.
+        Retrieves the JSON model definition for objects of this type.  This is computed
+        once when the class is created, and the same dictionary is returned on every call,
+        so it should not be modified.
         """
-        return {k: v for k, v in getattr(cls, cls._JSON_MODEL, {}).items()
-                if k not in cls.__exclusions__}
+        return cls.__model__
 
     @classmethod
     def from_json(cls, o: JSONObject, **kwargs) -> Self:
         """
         Parses the given JSON into an object of this type (or a subclass)
         """
-        model = cls.model()
-        copy = {k: v for k, v in o.items()
-                if not (mt := model.get(k, None)) or not mt.ephemeral}
+        copy = dict(o)
+        for k in cls.__ephemeral_fields__:
+            copy.pop(k, None)
         subclass = cls._extract_subclass(copy)
         return subclass(**copy, **kwargs)
 
@@ -206,18 +424,22 @@ class JSONModel(JSONConvertible, ABC, metaclass=JSONModelMeta):
         """
         Dumps the values in this object into a JSON-friendly dictionary
         """
+        cls = type(self)
         model = self.model()
-        dumped = {k: elem.dump_value(getattr(self, k), key=k)
-                  for k, elem in model.items()
-                  if not elem.ignored and not elem.ephemeral
-                  and (type(self).__include_defaults_in_json_output__ or
-                       not elem.has_default() or getattr(self, k) != elem.default)}
-
-        if not type(self).__allow_null_json_output__:
-            dumped = {k: v for k, v in dumped.items()
-                      if v is not None}
-        if type(self).__include_name_in_json_output__:
-            dumped[type(self).__name_field__] = self.model_identity()
+        fields = cls.__dump_fields__ if model is cls.__model__ else _dump_fields(model)
+        include_defaults = cls.__include_defaults_in_json_output__
+        allow_null = cls.__allow_null_json_output__
+        dumped = {}
+        for k, elem, has_default, dump_value in fields:
+            value = getattr(self, k)
+            if include_defaults or not has_default or value != elem.default:
+                value = dump_value(value, key=k)
+                if allow_null or value is not None:
+                    dumped[k] = value
+
+        if cls.__include_name_in_json_output__:
+            name_field, identity = cls._name_entry()
+            dumped[name_field] = identity
         return dumped
 
     #
@@ -230,6 +452,18 @@ class JSONModel(JSONConvertible, ABC, metaclass=JSONModelMeta):
     def model_identity(cls) -> JSONType:
         return cls.__name__
 
+    @classmethod
+    def _name_entry(cls) -> tuple[str, JSONType]:
+        """
+        Retrieves the (name field, identity) pair written into dumped output.  This is computed on first
+        use rather than when the class is created, as model_identity() may rely on names defined after
+        the class, and then kept on the class itself (not inherited by subclasses).
+        """
+        if (entry := cls.__dict__.get("__name_entry__")) is None:
+            entry = (cls.__name_field__, cls.model_identity())
+            setattr(cls, "__name_entry__", entry)
+        return entry
+
     @classmethod
     def _pop_name_from_name_field(cls, o: JSONObject) -> JSONType:
         name_field = cls.__name_field__
@@ -250,18 +484,57 @@ class JSONModel(JSONConvertible, ABC, metaclass=JSONModelMeta):
         name = cls._pop_name_from_name_field(o)
         return cls._extract_subclass_by_name(name)
 
+    @classmethod
+    def _all_subclasses(cls) -> tuple[type[Self], ...]:
+        """
+        Retrieves all subclasses of this class.  The result is cached until the next
+        JSONModel class is created.
+        """
+        if (subclasses := JSONModel._SUBCLASS_CACHE.get(cls)) is None:
+            subclasses = JSONModel._SUBCLASS_CACHE[cls] = tuple(ClassHelpers.all_subclasses(cls))
+        return subclasses
+
+    @classmethod
+    def _subclasses_by_identity(cls) -> dict[Hashable, type[Self]]:
+        """
+        Retrieves this class and all of its subclasses, keyed by their model identity.  Where
+        several classes share an identity, the first one found takes precedence.  The result
+        is cached until the next JSONModel class is created.
+        """
+        if (index := JSONModel._IDENTITY_CACHE.get(cls)) is None:
+            index = dict()
+            for subclass in itertools.chain((cls,), cls._all_subclasses()):
+                identity = subclass.model_identity()
+                if isinstance(identity, Hashable):
+                    index.setdefault(identity, subclass)
+            JSONModel._IDENTITY_CACHE[cls] = index
+        return index
+
+    @classmethod
+    def _scan_subclasses(cls, name: JSONType) -> type[Self] | None:
+        return cls if cls._subclass_match(name, cls) else \
+            next((sc for sc in cls._all_subclasses() if cls._subclass_match(name, sc)), None)
+
     @classmethod
     def _extract_subclass_by_name(cls, name: str) -> type[Self]:
         if isinstance(name, Hashable):
             _id = (name, cls)
             if _id in JSONModel._MODEL_CACHE:
                 return JSONModel._MODEL_CACHE[_id]
+            # With the default matching logic, the subclass can be looked up by its identity directly.
+            # Unhashable identities are left out of the index, but those can never equal a hashable
+            # name, so a miss here means there is no match and the hierarchy need not be scanned.
+            if cls._subclass_match.__func__ is JSONModel._subclass_match.__func__:
+                subclass = cls._subclasses_by_identity().get(name)
+            else:
+                subclass = cls._scan_subclasses(name)
+            if subclass is not None:
+                JSONModel._MODEL_CACHE[_id] = subclass
+        else:
+            subclass = cls._scan_subclasses(name)
 
-        for subclass in itertools.chain((cls,), ClassHelpers.all_subclasses(cls)):
-            if cls._subclass_match(name, subclass):
-                if isinstance(name, Hashable):
-                    JSONModel._MODEL_CACHE[(name, cls)] = subclass
-                return subclass
+        if subclass is not None:
+            return subclass
 
         raise JSONModelError(f"Unable to find suitable subclass for '{cls.__name__}' matching "
                              f"the name '{name}'; cannot parse JSONModel.")
@@ -282,32 +555,37 @@ class JSONModel(JSONConvertible, ABC, metaclass=JSONModelMeta):
     def _validate_model(cls, model: Mapping[str, ModelElem],
                         values: Mapping[str, Any],
                         ignore_extra: bool) -> dict[str, Any]:
+        fields = cls.__model_fields__ if model is cls.model() else _model_fields(model)
         result: dict[str, Any] = dict()
-        values = {**values}
-        for k, m in model.items():
-            if m.ignored:
-                values.pop(k, None)
+        consumed = 0
+        for k, m, ignored, has_default, validate in fields:
+            val = values.get(k, _MISSING)
+            if val is not _MISSING:
+                consumed += 1
+            if ignored:
                 continue
-            if k not in values:
-                if not m.has_default():
+            if val is _MISSING:
+                if not has_default:
                     raise JSONModelError(f"Missing required key '{k}' on '{cls.__name__}'.")
                 val = m.default
-            else:
-                val = values.pop(k)
             try:
-                val = m.validate(val, key=k)
+                val = validate(val, key=k)
             except ModelElemError as e:
                 raise JSONModelError(f"Model error on key '{k}' of '{cls.__name__}': {str(e)}")
 
             result[k] = val
 
-        if not ignore_extra and any(k for k in values.keys() if k not in cls.__exclusions__):
-            raise JSONModelError(f"The following keys are not found in the model for '{cls.__name__}': "
-                                 f"{','.join(values.keys())}")
+        # Only look for the unrecognized keys if some of the given values weren't consumed
+        if not ignore_extra and consumed < len(values):
+            extra = [k for k in values.keys() if k not in model and k not in cls.__exclusions__]
+            if extra:
+                raise JSONModelError(f"The following keys are not found in the model for '{cls.__name__}': "
+                                     f"{','.join(extra)}")
 
         return result
 
 
 class AbstractJSONModel(JSONModel):
+    __slots__ = ()
     __name_field_required__ = True
     __include_name_in_json_output__ = True
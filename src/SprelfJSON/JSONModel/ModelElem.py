@@ -11,8 +11,10 @@ from types import UnionType, NoneType, GeneratorType
 from collections.abc import Sequence, MutableSequence, Mapping, MutableMapping, MutableSet, Collection, \
     Iterator, Iterable, Generator, Set
 import typing_inspect
+import functools
 import inspect
 import base64
+import binascii
 import json
 import re
 from abc import ABC, abstractmethod
@@ -34,7 +36,27 @@ Supported: TypeAlias = (
 
 SupportedTypes: tuple[type[Any] | None, ...] = (None, *get_args(Supported))
 SupportedTypeMap = {t.__name__: t for t in SupportedTypes if t is not None}
-_SupportedTypes_O1 = set(SupportedTypes)
+_SupportedTypes_O1 = frozenset(SupportedTypes)
+_SupportedClasses = tuple(t for t in SupportedTypes if inspect.isclass(t))
+
+# Parsed JSON is almost always made of these builtins, so they are checked by exact type before
+# falling back to the (much slower) abstract base class checks
+_BUILTIN_MAPPINGS = (dict,)
+_BUILTIN_COLLECTIONS = (list, tuple, dict, set, frozenset, str, bytes)
+# Builtin containers of items that can be scanned before being iterated again (unlike an iterator)
+_BUILTIN_ARRAYS = (list, tuple, set, frozenset)
+
+
+def _is_mapping(val: Any) -> bool:
+    return type(val) in _BUILTIN_MAPPINGS or isinstance(val, Mapping)
+
+
+def _is_iterable(val: Any) -> bool:
+    return type(val) in _BUILTIN_COLLECTIONS or isinstance(val, Iterable)
+
+
+def _is_collection(val: Any) -> bool:
+    return type(val) in _BUILTIN_COLLECTIONS or isinstance(val, Collection)
 
 
 class ModelElemError(JSONModelError):
@@ -60,7 +82,12 @@ class _BaseModelElem:
         t, gen = type(self)._validate_definition(typ, _ephemeral, _type)
         self.origin: type[Supported] = t
         self.generics: tuple[_BaseModelElem, ...] = gen
+        # Resolved on first use by get_matching_model_type(), then read directly on every parse/dump/validate
         self._model_type: type[ModelType] | None = None
+        self._parse_fn: Callable[..., Supported] | None = None
+        self._dump_fn: Callable[[Supported], JSONType] | None = None
+        self._is_union = t == Union or typing_inspect.is_union_type(t)
+        self._candidates_by_type: dict[type, tuple[_BaseModelElem | None, ...]] = {}
 
     def __repr__(self) -> str:
         return str(self)
@@ -72,13 +99,13 @@ class _BaseModelElem:
         return len(self.generics) > 0
 
     def is_union(self) -> bool:
-        return self.origin == Union or typing_inspect.is_union_type(self.origin)
+        return self._is_union
 
     @property
     def T(self) -> type[T]:
         return self.origin
 
-    @property
+    @functools.cached_property
     def annotated_type(self) -> type[Supported]:
         return ClassHelpers.as_generic(self.origin, *(g.annotated_type for g in self.generics))
 
@@ -91,6 +118,8 @@ class _BaseModelElem:
 
     def is_valid(self, value: Any, *, key: str | None = None, **kwargs) -> bool:
         try:
+            if self._passes_through(value):
+                return True
             _ = self.validate(value, key=key, **kwargs)
             return True
         except ModelElemError:
@@ -105,7 +134,7 @@ class _BaseModelElem:
         if self._is_valid(parsed, key=key, **kwargs):
             return parsed
 
-        if isinstance(value, list) or isinstance(value, set):
+        if isinstance(value, (list, set)):
             t_str = f"{type(value).__name__}[{'|'.join({type(v).__name__ for v in value})}]"
         elif isinstance(value, Mapping):
             t_str = f"dict[{'|'.join({type(k).__name__ for k in value.keys()})}, " \
@@ -152,7 +181,7 @@ class _BaseModelElem:
 
     def validate_type(self, val: Supported, **kwargs) -> bool:
         try:
-            mt = self.get_matching_model_type(**kwargs)
+            mt = self._model_type or self.get_matching_model_type(**kwargs)
             return mt.is_valid(val, self, **kwargs)
         except ModelElemError:
             return False
@@ -165,9 +194,105 @@ class _BaseModelElem:
         return self._parse_value(val, **kwargs)
 
     def _parse_value(self, val: Any, **kwargs) -> Supported:
-        mt = self.get_matching_model_type(**kwargs)
+        mt = self._model_type or self.get_matching_model_type(**kwargs)
         return mt.parse(val, self, **kwargs)
 
+    def _is_valid_item(self, val: Any, **kwargs) -> bool:
+        """
+        Whether the given value (typically an item of a collection that has already been parsed) is
+        valid for this element.  Values that are already valid as they are get accepted without being
+        parsed again, which would otherwise repeat the parsing of every nested level below them;
+        anything else is checked by parsing it, as is_valid() does.
+        """
+        return self.validate_type(val, **kwargs) or self.is_valid(val, **kwargs)
+
+    def _passes_through(self, val: Any) -> bool:
+        """
+        Whether parsing the given value would just return it unchanged, which can be known without
+        parsing it when it is exactly of this element's (non-generic, concrete) type.
+        """
+        return type(val) is self.origin and self._is_passthrough()
+
+    def _cannot_parse(self, typ: type) -> bool:
+        """
+        Whether parsing a value of the given type is certain to fail, where the resolved ModelType can tell
+        that from the type alone; lets a union skip such members rather than raising and catching an error
+        for each.
+        """
+        return type(self).parse_value is _BaseModelElem.parse_value and self._rejects(typ)
+
+    def _rejects(self, typ: type) -> bool:
+        """
+        Whether _parse_value() is certain to fail for a value of the given type; see _cannot_parse().
+        """
+        if type(self)._parse_value is not _BaseModelElem._parse_value:
+            return False
+        mt = self._model_type or self.get_matching_model_type()
+        return mt.rejects(typ, self)
+
+    def _union_candidates(self, typ: type) -> tuple[_BaseModelElem | None, ...]:
+        """
+        For a union element, the members worth trying on a value of the given type, in order.  Members that
+        cannot parse the type are left out, and a member the value would pass through unchanged (including
+        None for an optional) is given as None and ends the sequence.  Both only depend on the type, so the
+        result is cached per type.
+        """
+        if (candidates := self._candidates_by_type.get(typ)) is None:
+            found = []
+            for g in self.generics:
+                try:
+                    if (typ is g.origin and g._is_passthrough()) or (typ is NoneType and g.origin is NoneType):
+                        found.append(None)
+                        break
+                    if g._cannot_parse(typ):
+                        continue
+                except ModelElemError:
+                    pass
+                found.append(g)
+            candidates = self._candidates_by_type[typ] = tuple(found)
+        return candidates
+
+    def _all_pass_through(self, values: Iterable[Any]) -> bool:
+        """
+        Whether every one of the given values would parse (and so validate) unchanged; see _passes_through().
+        """
+        origin = self.origin
+        return self._is_passthrough() and all(type(v) is origin for v in values)
+
+    def _dumps_unchanged(self) -> bool:
+        """
+        Whether dumping an already-validated value that passes through this element (see _passes_through())
+        returns the value itself, as it does for the plain JSON scalar types.
+        """
+        if type(self).dump_value is not _BaseModelElem.dump_value or \
+                type(self)._dump_value is not _BaseModelElem._dump_value or not self._is_passthrough():
+            return False
+        mt = self._model_type or self.get_matching_model_type()
+        return mt is ModelType_Basic
+
+    def _is_passthrough(self) -> bool:
+        if self.generics or type(self).parse_value is not _BaseModelElem.parse_value:
+            return False
+        mt = self._model_type or self.get_matching_model_type()
+        return issubclass(mt, ModelType_Concrete)
+
+    def _parser(self) -> Callable[..., Supported]:
+        """
+        Retrieves a function equivalent to parse_value(), for parsing many values in a row (such as the
+        items of a collection).  Where parse_value() has not been customized, this is the resolved
+        ModelType's parse method bound to this element, skipping the dispatch on every value.
+        """
+        if self._parse_fn is None:
+            if type(self).parse_value is not _BaseModelElem.parse_value or \
+                    type(self)._parse_value is not _BaseModelElem._parse_value:
+                return self.parse_value
+            try:
+                mt = self._model_type or self.get_matching_model_type()
+            except ModelElemError:
+                return self.parse_value  # Let the error surface if and when a value is parsed
+            self._parse_fn = functools.partial(mt.parse, elem=self)
+        return self._parse_fn
+
     #
 
     def dump_value(self, val: Supported, *, key: str | None = None, **kwargs) -> JSONType:
@@ -183,9 +308,26 @@ class _BaseModelElem:
         return self._dump_value(val, key=key)
 
     def _dump_value(self, val: Supported, **kwargs) -> JSONType:
-        mt = self.get_matching_model_type(**kwargs)
+        mt = self._model_type or self.get_matching_model_type(**kwargs)
         return mt.dump(val, self, **kwargs)
 
+    def _parsed_dumper(self) -> Callable[[Supported], JSONType]:
+        """
+        Retrieves a function for dumping values that were produced by validating with this element (such
+        as the items of a collection that has already been validated as a whole), without validating
+        them again as dump_value() would.
+        """
+        if self._dump_fn is None:
+            if type(self).dump_value is not _BaseModelElem.dump_value or \
+                    type(self)._dump_value is not _BaseModelElem._dump_value:
+                return self.dump_value
+            try:
+                mt = self._model_type or self.get_matching_model_type()
+            except ModelElemError:
+                return self.dump_value
+            self._dump_fn = functools.partial(mt.dump, elem=self, _parsed=True)
+        return self._dump_fn
+
     #
 
     @classmethod
@@ -193,22 +335,48 @@ class _BaseModelElem:
             tuple[type, tuple[_BaseModelElem, ...]]:
         t, gen = ClassHelpers.analyze_type(val_type)
         if t is None or (inspect.isclass(t) and not _ephemeral and not _type and
-                         all(not inspect.isclass(supported) or not issubclass(t, supported)
-                             for supported in SupportedTypes)):
+                         t not in _SupportedTypes_O1 and not issubclass(t, _SupportedClasses)):
             raise JSONModelError(f"Cannot define ModelElem with unsupported type '{t.__name__}'.")
         if len(gen) == 0:
             return t, ()
 
         if t == type:
-            return t, tuple(_BaseModelElem(arg, _type=True) for arg in gen)
+            return t, tuple(_generic_elem(arg, _type=True) for arg in gen)
 
         if inspect.isclass(t) and issubclass(t, dict) and len(gen) != 2:
             raise JSONModelError(f"Invalid dict definition for ModelElem: [{','.join(g.__name__ for g in gen)}]")
 
         if inspect.isclass(t) and issubclass(t, Ephemeral):
-            return t, tuple(_BaseModelElem(arg, _ephemeral=True) for arg in gen)
+            return t, tuple(_generic_elem(arg, _ephemeral=True) for arg in gen)
+
+        return t, tuple(_generic_elem(arg) for arg in gen)
+
+
+def _exact_type_key(typ: Any) -> tuple:
+    """
+    A key identifying a type definition exactly.  Type definitions compare equal regardless of the
+    order of their union members (Union[str, int] == Union[int, str]), but unions parse first-match-wins,
+    so the key also records every argument at every level, in order, along with its own type (keeping
+    Literal[1] and Literal[True] apart).
+    """
+    return typ, type(typ), tuple(map(_exact_type_key, get_args(typ)))
+
 
-        return t, tuple(_BaseModelElem(arg) for arg in gen)
+@functools.lru_cache(maxsize=4096)
+def _cached_generic_elem(key: tuple, _ephemeral: bool, _type: bool) -> _BaseModelElem:
+    return _BaseModelElem(key[0], _ephemeral=_ephemeral, _type=_type)
+
+
+def _generic_elem(typ: type[Supported], _ephemeral: bool = False, _type: bool = False) -> _BaseModelElem:
+    """
+    Retrieves the element for a generic argument of another element.  These hold nothing but the type
+    (and the resolved ModelType), so the same element is shared by every definition using exactly that
+    type, down to the order of any union members.
+    """
+    try:
+        return _cached_generic_elem(_exact_type_key(typ), _ephemeral, _type)
+    except TypeError:  # Unhashable type definition
+        return _BaseModelElem(typ, _ephemeral=_ephemeral, _type=_type)
 
 
 #
@@ -233,7 +401,7 @@ class ModelElem(_BaseModelElem):
         super().__init__(typ)
         self._ignored = ignored
         self._is_ephemeral = inspect.isclass(self.origin) and issubclass(self.origin, Ephemeral)
-        self._alternates = list(alternates)
+        self._alternates = tuple(alternates)
         self._use_alternates_only = use_alternates_only
         if default_factory is not None:
             self._default_factory = default_factory
@@ -277,53 +445,60 @@ class ModelElem(_BaseModelElem):
 
     # OVERRIDE
     def parse_value(self, val: Any, *, key: str | None = None, **kwargs) -> Supported:
-        if self.ignored:
+        if self._ignored:
             return None
 
         if not self._use_alternates_only:
-            try:
+            # Without alternates to fall back on, there's no need to catch anything
+            if not self._alternates:
                 return self._parse_value(val, key=key, **kwargs)
-            except:
-                if len(self._alternates) == 0:
-                    raise
+            # Values the primary type is certain to reject go straight to the alternates
+            try:
+                if not self._rejects(type(val)):
+                    return self._parse_value(val, key=key, **kwargs)
+            except Exception:
+                pass
 
         for a in self._alternates:
             try:
+                if a._cannot_parse(type(val)):
+                    continue
                 return a.transformer(a.parse_value(val, key=key, **kwargs))
-            except:
+            except Exception:
                 continue
         raise ModelElemError(self, f"Unable to parse value of type '{type(val).__name__}' as "
                                    f"an object of type '{self.annotated_type!r}'" +
                              (f" ({len(self._alternates)} alternate(s) also failed)"
-                              if len(self._alternates) > 0 else "") +
+                              if self._alternates else "") +
                              ".")
 
     # OVERRIDE
     def dump_value(self, val: Supported, *, key: str | None = None, **kwargs) -> JSONType:
-        if self.ignored:
+        if self._ignored:
             return None
-        if self.ephemeral:
+        if self._is_ephemeral:
             raise ModelElemError(self, "Cannot dump ephemeral object.")
 
         if not self._use_alternates_only:
+            if not self._alternates:
+                return self._dump_value(val, key=key, **kwargs)
             try:
                 return self._dump_value(val, key=key, **kwargs)
-            except:
-                if len(self._alternates) == 0:
-                    raise
+            except Exception:
+                pass
 
         for a in self._alternates:
             if a.jsonifier is None:
                 continue
             try:
                 return a.jsonifier(val)
-            except:
+            except Exception:
                 continue
 
         raise ModelElemError(self, f"Unable to dump value of type '{type(val).__name__}' as "
                                    f"an object of type '{self.annotated_type!r}'" +
                              (f" ({len(self._alternates)} alternates also failed)"
-                              if len(self._alternates) > 0 else "") +
+                              if self._alternates else "") +
                              ".")
 
     # OVERRIDE
@@ -368,13 +543,22 @@ class ModelType(ABC):
 
     @classmethod
     def is_valid(cls, val: Supported, elem: _BaseModelElem, **kwargs) -> bool:
-        return isinstance(val, elem.origin)
+        # Values are usually exactly of the expected type, which is cheaper to check than isinstance
+        return type(val) is elem.origin or isinstance(val, elem.origin)
 
     @classmethod
     @abstractmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
         pass
 
+    @classmethod
+    def rejects(cls, typ: type, elem: _BaseModelElem) -> bool:
+        """
+        Whether parse() is certain to fail for any value of the given type.  Returning False is always
+        safe; it just means parse() has to be attempted to find out.
+        """
+        return False
+
     @classmethod
     @abstractmethod
     def dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> JSONType:
@@ -393,6 +577,8 @@ class ModelType(ABC):
 
     @classmethod
     def _parse_for_dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Any:
+        if kwargs.get("_parsed", False):
+            return val
         try:
             return elem.validate(val)
         except ModelElemError as e:
@@ -456,9 +642,11 @@ class ModelType_Union(ModelType):
 
     @classmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
-        for g in elem.generics:
+        for g in elem._union_candidates(type(val)):
+            if g is None:
+                return val
             try:
-                return g.parse_value(val)
+                return g._parser()(val)
             except ModelElemError:
                 pass
         raise ModelElemError(elem, f"Given value of type '{type(val).__name__}' does not meet any of the allowed "
@@ -495,7 +683,7 @@ class ModelType_Optional(ModelType):
     def is_valid(cls, val: Supported, elem: _BaseModelElem, **kwargs) -> bool:
         if val is None:
             return True
-        return len(elem.generics) == 0 or elem.generics[0].is_valid(val)
+        return len(elem.generics) == 0 or elem.generics[0]._is_valid_item(val)
 
     @classmethod
     def dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> JSONType:
@@ -514,7 +702,7 @@ class ModelType_Generator(ModelType):
 
     @classmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
-        if not isinstance(val, Iterable):
+        if not _is_iterable(val):
             raise cls._parse_error(val, elem, f"; value is not iterable.")
         if len(elem.generics) > 0:
             return (elem.generics[0].dump_value(v) for v in val)  # Stays lazy
@@ -523,7 +711,7 @@ class ModelType_Generator(ModelType):
     @classmethod
     def dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> JSONType:
         parsed = cls._parse_for_dump(val, elem, **kwargs)
-        if not isinstance(parsed, Iterable):
+        if not _is_iterable(parsed):
             raise cls._dump_error(val, elem, f"is not iterable; cannot dump as a JSON array.", **kwargs)
         if len(elem.generics) > 0:
             return [elem.generics[0].dump_value(v) for v in parsed]
@@ -540,18 +728,18 @@ class ModelType_Sequence(ModelType_Generator):
     @classmethod
     def is_valid(cls, val: Supported, elem: _BaseModelElem, **kwargs) -> bool:
         return (isinstance(val, elem.origin)) \
-            and (len(elem.generics) == 0 or all(elem.generics[0].is_valid(x) for x in val))
+            and (len(elem.generics) == 0 or elem.generics[0]._all_pass_through(val)
+                 or all(map(elem.generics[0]._is_valid_item, val)))
 
     @classmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
-        if not isinstance(val, Iterable):
+        if not _is_iterable(val):
             raise cls._parse_error(val, elem, f"; value is not an iterable.")
-        if len(elem.generics) > 0:
-            val = (elem.generics[0].parse_value(v) for v in val)
+        parse = elem.generics[0]._parser() if len(elem.generics) > 0 else None
         if elem.origin in (Sequence, Collection, MutableSequence):
-            return list(val)
+            return list(map(parse, val)) if parse else list(val)
         elif elem.origin in (MutableSet, Set):
-            return set(val)
+            return set(map(parse, val)) if parse else set(val)
         raise ModelElemError(elem, f"Unable to find suitable type to parse value as given "
                                    f"the expected type '{elem.annotated_type!r}'")
 
@@ -574,26 +762,37 @@ class ModelType_List(ModelType_Object):
 
     @classmethod
     def is_valid(cls, val: Supported, elem: _BaseModelElem, **kwargs) -> bool:
-        return (isinstance(val, cls.t) and
-                (len(elem.generics) == 0 or all(elem.generics[0].is_valid(x, **kwargs)
-                                                for x in val)))
+        return ((type(val) is cls.t or isinstance(val, cls.t)) and
+                (len(elem.generics) == 0 or elem.generics[0]._all_pass_through(val)
+                 or all(map(functools.partial(elem.generics[0]._is_valid_item, **kwargs), val))))
 
     @classmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
-        if not isinstance(val, Iterable):
+        if not _is_iterable(val):
             raise cls._parse_error(val, elem, f"; object is not iterable.", **kwargs)
         if len(elem.generics) > 0:
-            return cls.t(elem.generics[0].parse_value(v, **kwargs) for v in val)
+            g = elem.generics[0]
+            # Items already of exactly the item type would each be returned unchanged
+            if type(val) in _BUILTIN_ARRAYS and g._all_pass_through(val):
+                return cls.t(val)
+            parse = g._parser()
+            if kwargs:
+                parse = functools.partial(parse, **kwargs)
+            # map() calls the parser for each item from C, without a bytecode loop or generator frame
+            return cls.t(map(parse, val))
         return cls.t(val)
 
     @classmethod
     def dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> JSONType:
         parsed = cls._parse_for_dump(val, elem, **kwargs)
-        if not isinstance(parsed, Iterable):
+        if not _is_iterable(parsed):
             raise cls._dump_error(val, elem, f"as an iterable; "
                                              f"cannot dump as a JSON array.", **kwargs)
         if len(elem.generics) > 0:
-            return [elem.generics[0].dump_value(v) for v in parsed]
+            g = elem.generics[0]
+            if g._dumps_unchanged() and g._all_pass_through(parsed):
+                return list(parsed)
+            return list(map(g._parsed_dumper(), parsed))
         return list(parsed)
 
 
@@ -613,26 +812,29 @@ class ModelType_Tuple(ModelType_List):
 
     @classmethod
     def is_valid(cls, val: Supported, elem: _BaseModelElem, **kwargs) -> bool:
-        if not isinstance(val, tuple):
+        if type(val) is not tuple and not isinstance(val, tuple):
             return False
         if len(elem.generics) == 2 and elem.generics[1].origin is Ellipsis:
-            return all(elem.generics[0].is_valid(x) for x in val)
+            return elem.generics[0]._all_pass_through(val) or all(map(elem.generics[0]._is_valid_item, val))
         if len(elem.generics) == 0:
             return True
         if len(elem.generics) != len(val):
             return False
-        return all(g.is_valid(x) for g, x in zip(elem.generics, val))
+        return all(g._is_valid_item(x) for g, x in zip(elem.generics, val))
 
     @classmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
-        if not isinstance(val, Collection):
+        if not _is_collection(val):
             raise cls._parse_error(val, elem, f"; value is not a collection.", **kwargs)
         if len(elem.generics) == 2 and elem.generics[1].origin is Ellipsis:
-            return cls.t(elem.generics[0].parse_value(v) for v in val)
+            g = elem.generics[0]
+            if type(val) in _BUILTIN_ARRAYS and g._all_pass_through(val):
+                return cls.t(val)
+            return cls.t(map(g._parser(), val))
         elif len(elem.generics) == 0:
             return cls.t(val)
         elif len(elem.generics) == len(val):
-            return cls.t(g.parse_value(v) for g, v in zip(elem.generics, val))
+            return cls.t([g._parser()(v) for g, v in zip(elem.generics, val)])
         raise cls._parse_error(val, elem, f"; has the wrong number of "
                                           f"elements to be parsed as a '{elem.annotated_type!r}'; has ({len(val)}).",
                                **kwargs)
@@ -643,18 +845,30 @@ class ModelType_Tuple(ModelType_List):
             return super().dump(val, elem, **kwargs)
 
         parsed = cls._parse_for_dump(val, elem, **kwargs)
-        if not isinstance(parsed, Iterable):
+        if not _is_iterable(parsed):
             raise cls._dump_error(val, elem, f" is not iterable; "
                                              f"cannot dump as a JSON array.", **kwargs)
         if len(elem.generics) == 0:
             return list(parsed)
         if len(val) == len(elem.generics):
-            return [g.dump_value(x) for x, g in zip(val, elem.generics)]
+            return [g._parsed_dumper()(x) for x, g in zip(parsed, elem.generics)]
         raise cls._parse_error(val, elem, f"; has the wrong number of "
                                           f"elements to be dumped as a '{elem.annotated_type!r}'; has ({len(val)}).",
                                **kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_json_key(key: str) -> Any:
+    return json.loads(key)
+
+
+def _json_key(key: str) -> Any:
+    # Object keys such as "1" repeat across records, so decoded scalars are shared from a cache; keys
+    # such as "[1, 2]" decode to mutable containers, which are decoded afresh for each caller instead
+    value = _cached_json_key(key)
+    return json.loads(key) if type(value) in (list, dict) else value
+
+
 # noinspection PyPep8Naming
 class ModelType_Dict(ModelType):
 
@@ -665,26 +879,30 @@ class ModelType_Dict(ModelType):
 
     @classmethod
     def is_valid(cls, val: Supported, elem: _BaseModelElem, **kwargs) -> bool:
-        return (isinstance(val, Mapping) and
-                (len(elem.generics) == 0 or all(elem.generics[0].is_valid(k) and elem.generics[1].is_valid(v)
-                                                for k, v in val.items())))
+        return (_is_mapping(val) and
+                (len(elem.generics) == 0 or
+                 (elem.generics[0]._all_pass_through(val.keys()) or
+                  all(map(elem.generics[0]._is_valid_item, val.keys()))) and
+                 (elem.generics[1]._all_pass_through(val.values()) or
+                  all(map(elem.generics[1]._is_valid_item, val.values())))))
 
     @classmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
-        if ClassHelpers.check_generic_instance(val, Iterable, tuple[Any, Any]):
+        if not _is_mapping(val) and ClassHelpers.check_generic_instance(val, Iterable, tuple[Any, Any]):
             d = {k: v for k, v in val}
         else:
             d = val
-        if isinstance(d, Mapping):
+        if _is_mapping(d):
             if len(elem.generics) == 0:
                 return d
+            parse_key, parse_val = elem.generics[0]._parser(), elem.generics[1]._parser()
             if all(isinstance(k, str) for k in d.keys()):
                 if inspect.isclass(elem.generics[0].origin) and issubclass(elem.generics[0].origin, str):
-                    return {str(k): elem.generics[1].parse_value(v) for k, v in d.items()}
-                return {elem.generics[0].parse_value(json.loads(k)): elem.generics[1].parse_value(v)
+                    return {str(k): parse_val(v) for k, v in d.items()}
+                return {parse_key(_json_key(k)): parse_val(v)
                         for k, v in d.items()}
             else:
-                return {elem.generics[0].parse_value(k): elem.generics[1].parse_value(v)
+                return {parse_key(k): parse_val(v)
                         for k, v in d.items()}
         raise cls._parse_error(val, elem, f"", **kwargs)
 
@@ -693,19 +911,23 @@ class ModelType_Dict(ModelType):
         parsed = cls._parse_for_dump(val, elem, **kwargs)
         if len(elem.generics) == 0:
             return dict(parsed)
+        dump_key, dump_val = elem.generics[0]._parsed_dumper(), elem.generics[1]._parsed_dumper()
         if inspect.isclass(elem.generics[0].origin):
             if issubclass(elem.generics[0].origin, str):
-                return {str(k): elem.generics[1].dump_value(v) for k, v in parsed.items()}
+                return {str(k): dump_val(v) for k, v in parsed.items()}
 
         return {(json.dumps(dk) if not isinstance(dk, str) else dk): dv
                 for dk, dv in
-                ((elem.generics[0].dump_value(k), elem.generics[1].dump_value(v)) for k, v in parsed.items())}
+                ((dump_key(k), dump_val(v)) for k, v in parsed.items())}
 
 
 # noinspection PyPep8Naming
 class ModelType_Type(ModelType_Object):
     t = type
     __output_full_class_name__: bool = True
+    # Names (in lowercase) recognized without needing to locate the class
+    _TYPE_NAMES: dict[str, type | None] = {"datetime": datetime, "date": date, "time": time,
+                                           "null": None, "none": None}
 
     @classmethod
     def is_valid(cls, val: Supported, elem: _BaseModelElem, **kwargs) -> bool:
@@ -715,14 +937,9 @@ class ModelType_Type(ModelType_Object):
     @classmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
         if isinstance(val, str):
-            if val.lower() == "datetime":
-                return datetime
-            elif val.lower() == "date":
-                return date
-            elif val.lower() == "time":
-                return time
-            elif val.lower() in ("null", "none"):
-                return None
+            lowered = val.lower()
+            if lowered in cls._TYPE_NAMES:
+                return cls._TYPE_NAMES[lowered]
             t = ClassHelpers.locate_class(val)
             if t is None:
                 raise ModelElemError(elem, f"Unable to parse string value '{val}' as a type; "
@@ -749,7 +966,7 @@ class ModelType_Concrete(ModelType_Object, ABC):
 
     @classmethod
     def parse(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
-        if isinstance(val, elem.origin):
+        if type(val) is elem.origin or isinstance(val, elem.origin):
             return val
         else:
             return cls._convert(val, elem, **kwargs)
@@ -765,7 +982,7 @@ class ModelType_Basic(ModelType_Concrete):
 
     @classmethod
     def test_origin(cls, elem: _BaseModelElem, **kwargs) -> bool:
-        return any(issubclass(elem.origin, x) for x in (str, int, float, bool))
+        return issubclass(elem.origin, (str, int, float, bool))
 
     @classmethod
     def _convert(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
@@ -773,11 +990,26 @@ class ModelType_Basic(ModelType_Concrete):
             return float(val)
         raise cls._parse_error(val, elem, "", **kwargs)
 
+    @classmethod
+    def rejects(cls, typ: type, elem: _BaseModelElem) -> bool:
+        # Mirrors parse(): only instances of the type itself, or ints for a float, are accepted
+        return not (issubclass(typ, elem.origin) or (issubclass(elem.origin, float) and issubclass(typ, int)))
+
     @classmethod
     def dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> JSONType:
         return cls._parse_for_dump(val, elem, **kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern | None:
+    # Compiled patterns are immutable, so the same object can be handed out for every parse of a string.
+    # Invalid patterns are cached too (as None), so that repeats of one are rejected without recompiling.
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
 # noinspection PyPep8Naming
 class ModelType_Pattern(ModelType_Concrete):
 
@@ -788,10 +1020,9 @@ class ModelType_Pattern(ModelType_Concrete):
     @classmethod
     def _convert(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
         if isinstance(val, str):
-            try:
-                return re.compile(val)
-            except:
+            if (pattern := _compile_pattern(val)) is None:
                 raise ModelElemError(elem, f"Unable to compile string as a regular expression.")
+            return pattern
         raise cls._parse_error(val, elem, f"", **kwargs)
 
     @classmethod
@@ -867,26 +1098,24 @@ class ModelType_TimeDelta(ModelType_Concrete):
     @classmethod
     def _convert(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
         if isinstance(val, str):
-            if m := TimeHelpers.TIMEDELTA_REGEX.match(val):
-                groups = m.groupdict()
-                try:
-                    return timedelta(days=int(groups.get("d", 0)) or 0,
-                                     hours=int(groups.get("h", 0)) or 0,
-                                     minutes=int(groups.get("m", 0)) or 0,
-                                     seconds=int(groups.get("s", 0)) or 0,
-                                     milliseconds=int(groups.get("ms", 0)) or 0)
-                except ValueError:
-                    pass
-            raise ModelElemError(elem, f"Unable to parse timedelta string; format is invalid.")
+            try:
+                return TimeHelpers.parse_timedelta_string(val)
+            except (ValueError, OverflowError):
+                raise ModelElemError(elem, f"Unable to parse timedelta string; format is invalid.")
         elif isinstance(val, int):
-            return timedelta(seconds=val / 1000)
+            # Milliseconds; split exactly rather than going through a float number of seconds
+            seconds, milliseconds = divmod(val, 1000)
+            return timedelta(0, seconds, milliseconds * 1000)
         elif isinstance(val, float):
             return timedelta(seconds=val)
         raise cls._parse_error(val, elem, "", **kwargs)
 
     @classmethod
     def dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> JSONType:
-        return int(cls._parse_for_dump(val, elem, **kwargs).total_seconds() * 1000)
+        td = cls._parse_for_dump(val, elem, **kwargs)
+        microseconds = (td.days * 86_400 + td.seconds) * 1_000_000 + td.microseconds
+        # Truncated toward zero, as int() of the float total would be, but without its rounding error
+        return microseconds // 1000 if microseconds >= 0 else -(-microseconds // 1000)
 
 
 # noinspection PyPep8Naming
@@ -896,6 +1125,10 @@ class ModelType_IntFlag(ModelType_Concrete):
     @classmethod
     def _convert(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
         if isinstance(val, int):
+            # Flag caches each composite value in _value2member_map_ once it has been built, so repeated
+            # values can be fetched from there without going through the flag's constructor
+            if (member := elem.origin._value2member_map_.get(val)) is not None:
+                return member
             try:
                 return elem.origin(val)
             except ValueError as e:
@@ -958,16 +1191,21 @@ class ModelType_Enum(ModelType_Concrete):
 
     @classmethod
     def test_origin(cls, elem: _BaseModelElem, **kwargs) -> bool:
-        return issubclass(elem.origin, Enum) and not any(issubclass(elem.origin, x)
-                                                         for x in (IntEnum, StrEnum, IntFlag))
+        return issubclass(elem.origin, Enum) and not issubclass(elem.origin, (IntEnum, StrEnum, IntFlag))
 
     @classmethod
     def _convert(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
-        if isinstance(val, str):
-            try:
-                return elem.origin[val]
-            except KeyError:
-                pass
+        # Look for a member by name without raising, as values that aren't names are expected here
+        if isinstance(val, str) and (member := elem.origin.__members__.get(val)) is not None:
+            return member
+        # Likewise by value, from the same map Enum's own lookup consults first; calling the enum is still
+        # needed for anything not in it (unhashable values, or ones resolved by a custom _missing_())
+        try:
+            member = elem.origin._value2member_map_.get(val)
+        except TypeError:
+            member = None  # Unhashable
+        if member is not None:
+            return member
         try:
             return elem.origin(val)
         except ValueError:
@@ -994,11 +1232,23 @@ class ModelType_JSON(ModelType_Concrete):
         raise cls._parse_error(val, elem, f"",
                                **kwargs)
 
+    @classmethod
+    def rejects(cls, typ: type, elem: _BaseModelElem) -> bool:
+        # Mirrors parse(): anything but an instance, a JSON string or a dict is an error (such as the None
+        # of an optional nested model)
+        return not issubclass(typ, (elem.origin, str, dict))
+
     @classmethod
     def dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> JSONType:
         return cls._parse_for_dump(val, elem, **kwargs).to_json()
 
 
+@functools.cache
+def _base64_table(altchars: bytes | None) -> bytes | None:
+    # Maps the given alternative characters onto the standard '+/', or None if there is nothing to map
+    return None if altchars is None or altchars == b"+/" else bytes.maketrans(altchars, b"+/")
+
+
 # noinspection PyPep8Naming
 class ModelType_Bytes(ModelType_Concrete):
     t = bytes
@@ -1006,27 +1256,37 @@ class ModelType_Bytes(ModelType_Concrete):
     @classmethod
     def _convert(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
         if isinstance(val, str):
-            for alt in type(elem).__base64_altchars__:
-                try:
-                    return base64.b64decode(val, alt)
-                except ValueError:
-                    pass
+            # Same decoding as base64.b64decode(val, alt), but encoding the string only once and
+            # reusing the translation tables, rather than rebuilding both for every alternative
+            if val.isascii():
+                data = val.encode("ascii")
+                for alt in type(elem).__base64_altchars__:
+                    table = _base64_table(alt)
+                    try:
+                        return binascii.a2b_base64(data if table is None else data.translate(table))
+                    except ValueError:
+                        pass
             raise ModelElemError(elem, f"Unable to parse string to bytes; is not valid base-64")
-        if ClassHelpers.check_generic_instance(val, Collection, int):
-            if all(0 <= x <= 255 for x in val):
+        # bytes() itself checks that every item is an integer in the range of 0-255, in a single pass
+        if _is_collection(val):
+            try:
                 return bytes(val)
-            raise ModelElemError(elem, f"Given array of integers to parse as bytes has one or more values "
-                                       f"outside the range of 0-255.")
+            except ValueError:
+                raise ModelElemError(elem, f"Given array of integers to parse as bytes has one or more values "
+                                           f"outside the range of 0-255.")
+            except TypeError:
+                pass  # Not all integers
         if ClassHelpers.check_generic_instance(val, Collection, str):
             try:
                 parsed = [int(s, 16) for s in val]
             except ValueError:
                 raise ModelElemError(elem, f"Given array of strings to parse as bytes has one or more invalid "
                                            f"hexadecimal strings.")
-            if all(0 <= x <= 255 for x in parsed):
+            try:
                 return bytes(parsed)
-            raise ModelElemError(elem, f"Given array of strings to parse as bytes has one or more hexadecimal "
-                                       f"values outside the range of 0-255.")
+            except ValueError:
+                raise ModelElemError(elem, f"Given array of strings to parse as bytes has one or more hexadecimal "
+                                           f"values outside the range of 0-255.")
 
     @classmethod
     def dump(cls, val: Any, elem: _BaseModelElem, **kwargs) -> Supported:
@@ -1,4 +1,13 @@
 from SprelfJSON.JSONDefinitions import JSONObject, JSONValue, JSONType, JSONArray, JSONContainer, FieldPath
+import functools
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    # Components stay strings here; conversion to array indices depends on what is being traversed
+    return tuple(path.split("."))
 
 
 def get(o: JSONValue, path: FieldPath, default: JSONType = None):
@@ -16,24 +25,29 @@ def get(o: JSONValue, path: FieldPath, default: JSONType = None):
     :return: The extract value, or the default value if not successful.
     """
     if isinstance(path, str):
-        path = tuple(path.split("."))
-    if len(path) == 0:
-        return o
-    if isinstance(o, JSONValue):
-        return default
-    curr, *rest = path
-    if isinstance(o, list):
-        if not isinstance(curr, int):
-            try:
-                curr = int(curr)
-            except ValueError:
+        path = _split_path(path)
+    elif isinstance(path, int):
+        path = (path,)
+    for curr in path:
+        if type(o) is dict:
+            if not isinstance(curr, str):
                 return default
-        if not (0 <= curr < len(o)):
-            return default
-        return get(o[curr], rest, default)
-    elif isinstance(o, dict):
-        if not isinstance(curr, str):
-            return default
-        if curr not in o:
+            o = o.get(curr, _MISSING)
+            if o is _MISSING:
+                return default
+        elif isinstance(o, list):
+            if not isinstance(curr, int):
+                try:
+                    curr = int(curr)
+                except ValueError:
+                    return default
+            if not (0 <= curr < len(o)):
+                return default
+            o = o[curr]
+        elif isinstance(o, dict):
+            if not isinstance(curr, str) or curr not in o:
+                return default
+            o = o[curr]
+        else:
             return default
-        return get(o[curr], rest, default)
+    return o
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Generic, TypeVar, Any, Iterator, Iterable, Self
 import copy
 import functools
+import operator
 
 T = TypeVar('T')
 
@@ -34,7 +35,7 @@ class Ephemeral(Generic[T]):
 
     @property
     def value(self) -> T:
-        return object.__getattribute__(self, type(self).__ephm_field__)
+        return _get_value(self)
 
     @property
     def V(self) -> T:
@@ -42,18 +43,18 @@ class Ephemeral(Generic[T]):
 
     # Attribute delegation
     def __getattr__(self, name: str) -> Any:
-        return getattr(self.value, name)
+        return getattr(_get_value(self), name)
 
     def __setattr__(self, name: str, value: Any) -> None:
         if name == type(self).__ephm_field__:
             object.__setattr__(self, name, value)
         else:
-            setattr(self.value, name, value)
+            setattr(_get_value(self), name, value)
 
     def __delattr__(self, name: str) -> None:
         if name == type(self).__ephm_field__:
             raise AttributeError("Cannot delete Ephemeral internal state")
-        delattr(self.value, name)
+        delattr(_get_value(self), name)
 
     def __dir__(self) -> list[str]:
         own = set(super().__dir__())
@@ -81,37 +82,63 @@ class Ephemeral(Generic[T]):
 
     @classmethod
     def is_ephemeral(cls, obj: Any) -> bool:
-        return isinstance(obj, cls) or getattr(obj, "__is_ephemeral__", False)
+        return type(obj) in _proxy_classes or isinstance(obj, cls) or getattr(obj, "__is_ephemeral__", False)
 
     @classmethod
     def unwrap(cls, o: Ephemeral[T] | T) -> T:
-        return o.value if isinstance(o, Ephemeral) else o
+        return _get_value(o) if isinstance(o, Ephemeral) else o
+
+
+# Reads the wrapped value straight from its slot, bypassing the `value` property
+_get_value = operator.attrgetter(Ephemeral.__ephm_field__)
+
+
+# Proxy class chosen for each wrapped type, so the supported dunders are only probed once per type
+_proxies_by_type: dict[type, type[Ephemeral]] = {}
+# Every proxy class built by _get_proxy(), which covers every Ephemeral instance
+_proxy_classes: set[type[Ephemeral]] = set()
 
 
 def _build(value: T) -> type[Ephemeral[T]]:
-    key = sorted((k
-                  for k in ("__len__", "__iter__", "__contains__", "__enter__", "__exit__",
-                            "__index__", "__int__", "__float__", "__complex__", "__bytes__",
-                            "__hash__")
-                  if hasattr(value, k)))
-    new_cls: type[Ephemeral] = _get_proxy(tuple(key))
+    # Classes carry their own attributes, so they can't share a proxy with the rest of their metaclass
+    if isinstance(value, type):
+        return _get_proxy(_proxy_key(value))
+    new_cls = _proxies_by_type.get(type(value))
+    if new_cls is None:
+        new_cls = _proxies_by_type[type(value)] = _get_proxy(_proxy_key(value))
     return new_cls
 
 
-@functools.cache
-def _get_proxy(key: tuple[str, ...]) -> type[Ephemeral]:
-    namespace: dict[str, Any] = {}
+def _proxy_key(value: Any) -> tuple[str, ...]:
+    return tuple(sorted((k
+                         for k in ("__len__", "__iter__", "__contains__", "__enter__", "__exit__",
+                                   "__index__", "__int__", "__float__", "__complex__", "__bytes__",
+                                   "__hash__")
+                         # A dunder set to None (e.g. list.__hash__) means the protocol is unsupported
+                         if getattr(value, k, None) is not None)))
 
-    namespace["__repr__"] = lambda self: f"{type(self).__name__}({self.value!r})"
-    namespace["__str__"] = lambda self: f"{str(self.value)}"
-    namespace["__bool__"] = lambda self: bool(self.value)
 
-    namespace["__eq__"] = lambda self, other: self.value == (other.value if isinstance(other, Ephemeral) else other)
-    namespace["__ne__"] = lambda self, other: self.value != (other.value if isinstance(other, Ephemeral) else other)
-    namespace["__lt__"] = lambda self, other: self.value < (other.value if isinstance(other, Ephemeral) else other)
-    namespace["__le__"] = lambda self, other: self.value <= (other.value if isinstance(other, Ephemeral) else other)
-    namespace["__gt__"] = lambda self, other: self.value > (other.value if isinstance(other, Ephemeral) else other)
-    namespace["__ge__"] = lambda self, other: self.value >= (other.value if isinstance(other, Ephemeral) else other)
+@functools.cache
+def _get_proxy(key: tuple[str, ...]) -> type[Ephemeral]:
+    # No per-instance __dict__; attribute writes are forwarded to the wrapped value anyway
+    namespace: dict[str, Any] = {"__slots__": ("__weakref__",)}
+
+    namespace["__repr__"] = lambda self: f"{type(self).__name__}({_get_value(self)!r})"
+    namespace["__str__"] = lambda self: f"{str(_get_value(self))}"
+    namespace["__bool__"] = lambda self: bool(_get_value(self))
+
+    namespace["__eq__"] = lambda self, other: \
+        _get_value(self) == (_get_value(other) if isinstance(other, Ephemeral) else other)
+    namespace["__ne__"] = lambda self, other: \
+        _get_value(self) != (_get_value(other) if isinstance(other, Ephemeral) else other)
+    namespace["__lt__"] = lambda self, other: \
+        _get_value(self) < (_get_value(other) if isinstance(other, Ephemeral) else other)
+    namespace["__le__"] = lambda self, other: \
+        _get_value(self) <= (_get_value(other) if isinstance(other, Ephemeral) else other)
+    namespace["__gt__"] = lambda self, other: \
+        _get_value(self) > (_get_value(other) if isinstance(other, Ephemeral) else other)
+    namespace["__ge__"] = lambda self, other: \
+        _get_value(self) >= (_get_value(other) if isinstance(other, Ephemeral) else other)
 
     for dund in key:
 
@@ -119,64 +146,65 @@ def _get_proxy(key: tuple[str, ...]) -> type[Ephemeral]:
         match dund:
             case "__len__":
                 def __len__(self):
-                    return len(self.value)
+                    return len(_get_value(self))
 
                 namespace[dund] = __len__
             case "__iter__":
                 def __iter__(self) -> Iterator:
-                    return iter(self.value)
+                    return iter(_get_value(self))
 
                 namespace[dund] = __iter__
             case "__contains__":
                 def __contains__(self, item: Any) -> bool:
-                    return item in self.value
+                    return item in _get_value(self)
 
                 namespace[dund] = __contains__
             case "__call__":
                 def __call__(self, *args: Any, **kwargs: Any) -> Any:
-                    return self.value(*args, **kwargs)
+                    return _get_value(self)(*args, **kwargs)
 
                 namespace[dund] = __call__
             case "__enter__":
                 def __enter__(self) -> Ephemeral[T]:
-                    return self.value.__enter__()
+                    return _get_value(self).__enter__()
 
                 namespace[dund] = __enter__
             case "__exit__":
                 def __exit__(self, *args: Any) -> Ephemeral[T]:
-                    return self.value.__exit__(*args)
+                    return _get_value(self).__exit__(*args)
 
                 namespace[dund] = __exit__
             case "__index__":
                 def __index__(self) -> int:
-                    return self.value.__index__()
+                    return _get_value(self).__index__()
 
                 namespace[dund] = __index__
             case "__int__":
                 def __int__(self) -> int:
-                    return int(self.value)
+                    return int(_get_value(self))
 
                 namespace[dund] = __int__
             case "__float__":
                 def __float__(self) -> float:
-                    return float(self.value)
+                    return float(_get_value(self))
 
                 namespace[dund] = __float__
             case "__complex__":
                 def __complex__(self) -> complex:
-                    return complex(self.value)
+                    return complex(_get_value(self))
 
                 namespace[dund] = __complex__
             case "__bytes__":
                 def __bytes__(self) -> bytes:
-                    return bytes(self.value)
+                    return bytes(_get_value(self))
 
                 namespace[dund] = __bytes__
             case "__hash__":
                 def __hash__(self) -> int:
-                    return hash(self.value)
+                    return hash(_get_value(self))
 
                 namespace[dund] = __hash__
 
     new_cls: type[Ephemeral] = type(f"EphmProxy[{','.join(key)}]", (Ephemeral,), namespace)
+    _proxy_classes.add(new_cls)
     return new_cls
\ No newline at end of file
@@ -163,6 +163,53 @@ class TestJSONModel(unittest.TestCase):
         self.assertEqual(model2.union_val, 42)
 
 
+# ---------------------------
+# ✅ FIELDS NAMED LIKE BUILTINS
+# ---------------------------
+
+    class BuiltinNamesModel(JSONModel):
+        type: str
+        zip: int = 1
+        str: bool = False
+
+    def test_fields_named_like_builtins(self):
+        model = self.BuiltinNamesModel(type="a")
+        self.assertEqual("a", model.type)
+        self.assertEqual(1, model.zip)
+        self.assertEqual({"type": "a"}, model.to_json())
+        with self.assertRaises(JSONModelError):
+            self.BuiltinNamesModel(type=5)
+        with self.assertRaises(JSONModelError):
+            self.BuiltinNamesModel(type="a", extra=1)
+
+    def test_fields_not_named_as_identifiers(self):
+        model_cls = type("NonIdentifierModel", (JSONModel,),
+                         {"__annotations__": {"my-field": int, "class": str}})
+        model = model_cls(**{"my-field": 1, "class": "x"})
+        self.assertEqual({"my-field": 1, "class": "x"}, model.to_json())
+        self.assertEqual(1, model_cls.from_json({"my-field": 1, "class": "x"}).to_json()["my-field"])
+        with self.assertRaises(JSONModelError):
+            model_cls(**{"my-field": "a", "class": "x"})
+
+
+# ---------------------------
+# ✅ CUSTOMIZED MODEL
+# ---------------------------
+
+    class NarrowedModel(JSONModel):
+        a: int
+        b: int = 0
+
+        @classmethod
+        def model(cls) -> dict[str, ModelElem]:
+            return {k: v for k, v in super().model().items() if k != "b"}
+
+    def test_model_override_used_on_construction(self):
+        self.assertEqual({"a": 1}, self.NarrowedModel(a=1).to_json())
+        with self.assertRaises(JSONModelError):
+            self.NarrowedModel(a=1, b=2)
+
+
 # ---------------------------
 # ✅ JSON-Like
 # ---------------------------
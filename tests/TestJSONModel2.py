@@ -3,6 +3,7 @@ import datetime
 import enum
 import re
 import base64
+import weakref
 from typing import Optional, Union
 
 from SprelfJSON import *
@@ -117,6 +118,15 @@ class ModelWithIgnoredField(JSONModel):
     regular_field: str
     ignored_field: ModelElem(int, ignored=True)
 
+class SlottedModel(JSONModel):
+    __use_slots__ = True
+    slotted_field: str
+    slotted_default: int = 5
+
+class SlottedSubModel(SlottedModel):
+    slotted_default: int = 6
+    sub_slotted_field: bool = False
+
 class CustomClassNotSupported:
     def __init__(self, name: str):
         self.name = name
@@ -257,6 +267,22 @@ class TestJSONModel(unittest.TestCase):
         dumped_complex = model_complex.to_json()
         self.assertEqual(json_data_complex, dumped_complex)
 
+        # Timedelta given as a string
+        for td_str, expected in (("days=1,hours=2,minutes=3,seconds=4", datetime.timedelta(days=1, hours=2, minutes=3, seconds=4)),
+                                 ("seconds=4", datetime.timedelta(seconds=4)),
+                                 ("minutes=3,seconds=4.500", datetime.timedelta(minutes=3, seconds=4, milliseconds=500)),
+                                 ("seconds=4.5", datetime.timedelta(seconds=4, milliseconds=500)),
+                                 ("seconds=4.05", datetime.timedelta(seconds=4, milliseconds=50)),
+                                 ("seconds=4.123456", datetime.timedelta(seconds=4, microseconds=123456))):
+            model_td = ModelWithComplexTypes.from_json({**json_data_complex, "timedelta_field": td_str})
+            self.assertEqual(expected, model_td.timedelta_field)
+
+        # Timedelta milliseconds survive a round trip exactly
+        for td_ms in (1005, -1005, 1, -1):
+            model_td = ModelWithComplexTypes.from_json({**json_data_complex, "timedelta_field": td_ms})
+            self.assertEqual(datetime.timedelta(milliseconds=td_ms), model_td.timedelta_field)
+            self.assertEqual(td_ms, model_td.to_json()["timedelta_field"])
+
         # Enum types
         json_data_enums = {
             "color": "RED",
@@ -330,6 +356,19 @@ class TestJSONModel(unittest.TestCase):
         sub_a_default_shared = SubModelA(base_field="base_a", sub_a_field="sub_a_val")
         self.assertEqual(10, sub_a_default_shared.shared_field) # Subclass default
 
+    def test_slotted_model(self):
+        model = SlottedModel(slotted_field="a")
+        self.assertEqual(("slotted_field", "slotted_default", "__weakref__"), SlottedModel.__slots__)
+        self.assertFalse(hasattr(model, "__dict__"))
+        self.assertIs(model, weakref.ref(model)())
+        self.assertEqual(5, model.slotted_default)
+
+        sub_model = SlottedSubModel.from_json({"slotted_field": "b", "sub_slotted_field": True})
+        self.assertEqual(("sub_slotted_field",), SlottedSubModel.__slots__)
+        self.assertFalse(hasattr(sub_model, "__dict__"))
+        self.assertEqual(6, sub_model.slotted_default)
+        self.assertEqual({"slotted_field": "b", "sub_slotted_field": True}, sub_model.to_json())
+
     def test_dynamic_subclass_parsing(self):
         json_sub_a = {
             "__type": "SubA",
@@ -905,6 +944,38 @@ class TestModelElem_JSONLike(unittest.TestCase):
             me_arr.dump_value([set()])  # invalid element
         self.assertIn("could not be dumped", str(cm3.exception))
 
+    def test_nested_union_member_order(self):
+        # Nested unions with the same members in a different order compare equal, but must each keep
+        # their own order, as the first member able to parse a value wins
+        class FirstOrder(JSONModel):
+            xs: list[Union[str, datetime.datetime]]
+            fs: list[Union[int, float]]
+
+        class SecondOrder(JSONModel):
+            xs: list[Union[datetime.datetime, str]]
+            fs: list[Union[float, int]]
+
+        data = {"xs": ["2024-01-01T00:00:00Z"], "fs": [5]}
+        first = FirstOrder.from_json(data)
+        self.assertEqual(["2024-01-01T00:00:00Z"], first.xs)
+        self.assertIs(int, type(first.fs[0]))
+        second = SecondOrder.from_json(data)
+        self.assertEqual([datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)], second.xs)
+        self.assertIs(float, type(second.fs[0]))
+
+    def test_model_identity_resolved_on_use(self):
+        # model_identity() may rely on names that only exist once the class has been created
+        class LateIdentityModel(JSONModel):
+            __include_name_in_json_output__ = True
+            a: int
+
+            @classmethod
+            def model_identity(cls) -> str:
+                return identities[cls.__name__]
+
+        identities = {"LateIdentityModel": "late"}
+        self.assertEqual({"a": 1, "__name": "late"}, LateIdentityModel(a=1).to_json())
+        self.assertEqual(1, LateIdentityModel.from_json({"a": 1, "__name": "late"}).a)
 
 
 if __name__ == '__main__':